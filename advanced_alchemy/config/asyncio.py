@@ -4,13 +4,16 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from advanced_alchemy.config.common import (
     GenericAlembicConfig,
     GenericSessionConfig,
     GenericSQLAlchemyConfig,
 )
+from advanced_alchemy.config.engine import EngineConfig
 from advanced_alchemy.config.types import Empty
+from advanced_alchemy.exceptions import ImproperConfigurationError
 
 if TYPE_CHECKING:
     from typing import Callable
@@ -54,6 +57,19 @@ class SQLAlchemyAsyncConfig(GenericSQLAlchemyConfig[AsyncEngine, AsyncSession, a
     """Callable that creates an :class:`AsyncEngine <sqlalchemy.ext.asyncio.AsyncEngine>` instance or instance of its
     subclass.
     """
+    engine_config: EngineConfig = field(default_factory=EngineConfig)
+    """Configuration for the SQLAlchemy engine.
+
+    The configuration options are documented in the SQLAlchemy documentation.
+
+    Notes:
+        - Async engines use :class:`AsyncAdaptedQueuePool <sqlalchemy.pool.AsyncAdaptedQueuePool>` by default, which
+          keeps ``pool_size`` (default ``5``) connections open and allows ``max_overflow`` (default ``10``) extra
+          connections under load. Size ``pool_size + max_overflow`` to the number of tasks expected to hold a session
+          concurrently, otherwise requests will queue for up to ``pool_timeout`` seconds waiting on a connection.
+        - ``pool_pre_ping`` and ``pool_recycle`` protect against stale connections at the cost of extra round trips.
+        - The synchronous :class:`QueuePool <sqlalchemy.pool.QueuePool>` cannot be used with an async engine.
+    """
     session_config: AsyncSessionConfig = field(default_factory=AsyncSessionConfig)
     """Configuration options for the :class:`async_sessionmaker<sqlalchemy.ext.asyncio.async_sessionmaker>`."""
     session_maker_class: type[async_sessionmaker] = async_sessionmaker
@@ -65,6 +81,14 @@ class SQLAlchemyAsyncConfig(GenericSQLAlchemyConfig[AsyncEngine, AsyncSession, a
     """
 
     def __post_init__(self) -> None:
+        poolclass = self.engine_config.poolclass
+        if (
+            isinstance(poolclass, type)
+            and issubclass(poolclass, QueuePool)
+            and not issubclass(poolclass, AsyncAdaptedQueuePool)
+        ):
+            msg = f"'{poolclass.__name__}' cannot be used with an async engine, use 'AsyncAdaptedQueuePool' instead."
+            raise ImproperConfigurationError(msg)
         if self.metadata:
             self.alembic_config.target_metadata = self.metadata
         super().__post_init__()
@@ -5,6 +5,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable, Generic, TypeVar
 
+from sqlalchemy import event
+
 from advanced_alchemy.base import orm_registry
 from advanced_alchemy.config.engine import EngineConfig
 from advanced_alchemy.config.types import Empty, filter_empty
@@ -14,6 +16,7 @@ if TYPE_CHECKING:
     from typing import Any
 
     from sqlalchemy import Connection, Engine, MetaData
+    from sqlalchemy.engine import ExceptionContext
     from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, async_sessionmaker
     from sqlalchemy.orm import Mapper, Query, Session, sessionmaker
     from sqlalchemy.orm.session import JoinTransactionMode
@@ -38,6 +41,32 @@ SessionMakerT = TypeVar("SessionMakerT", bound="sessionmaker | async_sessionmake
 """Type variable for a SQLAlchemy sessionmaker."""
 
 
+def _fields_to_dict(obj: Any) -> dict[str, Any]:
+    """Convert a dataclass instance to a dict without copying its values.
+
+    Unlike :func:`dataclasses.asdict`, field values are not deep-copied, so engines, connections and callables are
+    passed through as-is.
+
+    Args:
+        obj: The dataclass instance to convert.
+
+    Returns:
+        A string keyed dict of the dataclass field values.
+    """
+    return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+
+
+def _invalidate_connection_only(context: ExceptionContext) -> None:
+    """Restrict disconnect handling to the connection that raised the error.
+
+    Args:
+        context: The exception context of the failed statement.
+    """
+    # ExceptionContext declares its attributes in ``__slots__`` without this one, but it is the documented way for a
+    # ``handle_error`` listener to opt out of invalidating the pool.
+    context.invalidate_pool_on_disconnect = False  # type: ignore[misc]
+
+
 @dataclass
 class GenericSessionConfig(Generic[ConnectionT, EngineT, SessionT]):
     """SQLAlchemy async session config."""
@@ -125,6 +154,11 @@ class GenericSQLAlchemyConfig(Generic[EngineT, SessionT, SessionMakerT]):
 
       If set, the plugin will use the provided instance rather than the default metadata."""
 
+    _engine_instance: EngineT | None = field(default=None, init=False, repr=False, compare=False)
+    """Engine created by :meth:`get_engine`, reused by later calls."""
+    _session_maker: Callable[[], SessionT] | None = field(default=None, init=False, repr=False, compare=False)
+    """Session maker created by :meth:`create_session_maker`, reused by later calls."""
+
     def __post_init__(self) -> None:
         if self.connection_string is not None and self.engine_instance is not None:
             msg = "Only one of 'connection_string' or 'engine_instance' can be provided."
@@ -138,7 +172,9 @@ class GenericSQLAlchemyConfig(Generic[EngineT, SessionT, SessionMakerT]):
             A string keyed dict of config kwargs for the SQLAlchemy :func:`get_engine <sqlalchemy.get_engine>`
             function.
         """
-        return filter_empty(dataclasses.asdict(self.engine_config))
+        engine_config = filter_empty(_fields_to_dict(self.engine_config))
+        engine_config.pop("pool_recycle_on_disconnect", None)
+        return engine_config
 
     @property
     def session_config_dict(self) -> dict[str, Any]:
@@ -148,7 +184,7 @@ class GenericSQLAlchemyConfig(Generic[EngineT, SessionT, SessionMakerT]):
             A string keyed dict of config kwargs for the SQLAlchemy :class:`sessionmaker <sqlalchemy.orm.sessionmaker>`
             class.
         """
-        return filter_empty(dataclasses.asdict(self.session_config))
+        return filter_empty(_fields_to_dict(self.session_config))
 
     def get_engine(self) -> EngineT:
         """Return an engine. If none exists yet, create one.
@@ -157,20 +193,39 @@ class GenericSQLAlchemyConfig(Generic[EngineT, SessionT, SessionMakerT]):
             Getter that returns the engine instance used by the plugin.
         """
         if self.engine_instance:
-            return self.engine_instance
+            return self._listen_for_disconnects(self.engine_instance)
 
         if self.connection_string is None:
             msg = "One of 'connection_string' or 'engine_instance' must be provided."
             raise ImproperConfigurationError(msg)
 
+        if self._engine_instance is not None:
+            return self._engine_instance
+
         engine_config = self.engine_config_dict
         try:
-            return self.create_engine_callable(self.connection_string, **engine_config)
+            self._engine_instance = self.create_engine_callable(self.connection_string, **engine_config)
         except TypeError:
             # likely due to a dialect that doesn't support json type
             del engine_config["json_deserializer"]
             del engine_config["json_serializer"]
-            return self.create_engine_callable(self.connection_string, **engine_config)
+            self._engine_instance = self.create_engine_callable(self.connection_string, **engine_config)
+        return self._listen_for_disconnects(self._engine_instance)
+
+    def _listen_for_disconnects(self, engine: EngineT) -> EngineT:
+        """Apply ``engine_config.pool_recycle_on_disconnect`` to ``engine``.
+
+        Args:
+            engine: The engine created by, or provided to, the config.
+
+        Returns:
+            The same engine.
+        """
+        if not self.engine_config.pool_recycle_on_disconnect:
+            sync_engine = getattr(engine, "sync_engine", engine)
+            if not event.contains(sync_engine, "handle_error", _invalidate_connection_only):
+                event.listen(sync_engine, "handle_error", _invalidate_connection_only)
+        return engine
 
     def create_session_maker(self) -> Callable[[], SessionT]:
         """Get a session maker. If none exists yet, create one.
@@ -180,11 +235,14 @@ class GenericSQLAlchemyConfig(Generic[EngineT, SessionT, SessionMakerT]):
         """
         if self.session_maker:
             return self.session_maker
+        if self._session_maker is not None:
+            return self._session_maker
 
         session_kws = self.session_config_dict
         if session_kws.get("bind") is None:
             session_kws["bind"] = self.get_engine()
-        return self.session_maker_class(**session_kws)
+        self._session_maker = self.session_maker_class(**session_kws)
+        return self._session_maker
 
 
 @dataclass
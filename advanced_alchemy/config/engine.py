@@ -115,7 +115,14 @@ class EngineConfig:
     “sqlalchemy.pool” logger. Defaults to a hexstring of the object`s id."""
     pool_pre_ping: bool | EmptyType = Empty
     """If True will enable the connection pool “pre-ping” feature that tests connections for liveness upon each
-    checkout."""
+    checkout. This costs an extra round trip per checkout; when backend failures are rare, relying on the reactive
+    invalidation controlled by :attr:`pool_recycle_on_disconnect` is usually sufficient."""
+    pool_recycle_on_disconnect: bool = True
+    """If ``True``, a disconnect error raised by any statement invalidates every connection in the pool, so stale
+    connections are replaced on their next checkout without a per-checkout ping. If ``False``, only the connection that
+    raised the error is discarded, which avoids reconnecting the whole pool for isolated failures. This option is
+    handled through a ``handle_error`` event listener and is not passed to :func:`create_engine
+    <sqlalchemy.create_engine>`, so it also applies to an engine provided as ``engine_instance``."""
     pool_size: int | EmptyType = Empty
     """The number of connections to keep open inside the connection pool. This used with
     :class:`QueuePool <sqlalchemy.pool.QueuePool>` as well as
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import logging
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Callable, cast
 
 from litestar.constants import HTTP_RESPONSE_START
+from litestar.status_codes import HTTP_200_OK, HTTP_300_MULTIPLE_CHOICES
 from litestar.utils import delete_litestar_scope_state, get_litestar_scope_state, set_litestar_scope_state
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
@@ -11,6 +14,7 @@ from advanced_alchemy.config.asyncio import SQLAlchemyAsyncConfig as _SQLAlchemy
 from advanced_alchemy.extensions.litestar.plugins.init.config.common import (
     SESSION_SCOPE_KEY,
     SESSION_TERMINUS_ASGI_EVENTS,
+    create_missing_tables,
 )
 from advanced_alchemy.extensions.litestar.plugins.init.config.engine import EngineConfig
 
@@ -31,6 +35,8 @@ __all__ = (
     "autocommit_before_send_handler",
 )
 
+logger = logging.getLogger(__name__)
+
 
 async def default_before_send_handler(message: Message, scope: Scope) -> None:
     """Handle closing and cleaning up sessions before sending.
@@ -42,22 +48,71 @@ async def default_before_send_handler(message: Message, scope: Scope) -> None:
     Returns:
         None
     """
+    if message["type"] not in SESSION_TERMINUS_ASGI_EVENTS:
+        return
     session = cast("AsyncSession | None", get_litestar_scope_state(scope, SESSION_SCOPE_KEY))
-    if session and message["type"] in SESSION_TERMINUS_ASGI_EVENTS:
-        await session.close()
+    if session:
         delete_litestar_scope_state(scope, SESSION_SCOPE_KEY)
+        await asyncio.shield(session.close())
+
+
+async def _autocommit_success_handler(message: Message, scope: Scope) -> None:
+    """Handle commit/rollback on ``2XX`` responses, closing and cleaning up sessions before sending.
+
+    Args:
+        message: ASGI-``Message``
+        scope: An ASGI-``Scope``
+
+    Returns:
+        None
+    """
+    msg_type = message["type"]
+    if msg_type not in SESSION_TERMINUS_ASGI_EVENTS:
+        return
+    session = cast("AsyncSession | None", get_litestar_scope_state(scope, SESSION_SCOPE_KEY))
+    if session is None:
+        return
+    commit: bool | None = None
+    if msg_type == HTTP_RESPONSE_START:
+        commit = HTTP_200_OK <= cast("HTTPResponseStartEvent", message)["status"] < HTTP_300_MULTIPLE_CHOICES
+    delete_litestar_scope_state(scope, SESSION_SCOPE_KEY)
+    await _finalize_session(session, commit)
+
+
+async def _finalize_session(session: AsyncSession, commit: bool | None) -> None:
+    """Commit or roll back the session, then close it.
+
+    Args:
+        session: The session to finalize.
+        commit: ``True`` to commit, ``False`` to roll back and ``None`` to only close the session.
+    """
+    try:
+        if commit is True:
+            await session.commit()
+        elif commit is False:
+            await session.rollback()
+    finally:
+        await asyncio.shield(session.close())
 
 
 def autocommit_handler_maker(
     commit_on_redirect: bool = False,
     extra_commit_statuses: set[int] | None = None,
     extra_rollback_statuses: set[int] | None = None,
+    commit_in_background: bool = False,
 ) -> Callable[[Message, Scope], Coroutine[Any, Any, None]]:
     """Set up the handler to issue a transaction commit or rollback based on specified status codes
     Args:
         commit_on_redirect: Issue a commit when the response status is a redirect (``3XX``)
         extra_commit_statuses: A set of additional status codes that trigger a commit
         extra_rollback_statuses: A set of additional status codes that trigger a rollback
+        commit_in_background: Schedule the commit/rollback and close as a task instead of awaiting it before the
+            response is sent. Pending tasks are kept in the handler's ``background_tasks`` set and awaited by
+            :meth:`SQLAlchemyAsyncConfig.on_shutdown`.
+
+            .. warning::
+                The response is sent before the database acknowledges the commit, so a failed commit can no longer
+                be reported to the client. It is logged instead.
 
     Returns:
         The handler callable
@@ -72,7 +127,18 @@ def autocommit_handler_maker(
         msg = "Extra rollback statuses and commit statuses must not share any status codes"
         raise ValueError(msg)
 
-    commit_range = range(200, 300 if not commit_on_redirect else 400)
+    if not (commit_on_redirect or extra_commit_statuses or extra_rollback_statuses or commit_in_background):
+        return _autocommit_success_handler
+
+    commit_statuses = frozenset(
+        (set(range(200, 400 if commit_on_redirect else 300)) | extra_commit_statuses) - extra_rollback_statuses,
+    )
+    background_tasks: set[asyncio.Task[None]] = set()
+
+    def _background_task_done(task: asyncio.Task[None]) -> None:
+        background_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Failed to commit or roll back the session in the background", exc_info=task.exception())
 
     async def handler(message: Message, scope: Scope) -> None:
         """Handle commit/rollback, closing and cleaning up sessions before sending.
@@ -84,21 +150,25 @@ def autocommit_handler_maker(
         Returns:
             None
         """
+        msg_type = message["type"]
+        if msg_type not in SESSION_TERMINUS_ASGI_EVENTS:
+            return
         session = cast("AsyncSession | None", get_litestar_scope_state(scope, SESSION_SCOPE_KEY))
-        try:
-            if session is not None and message["type"] == HTTP_RESPONSE_START:
-                if (
-                    cast("HTTPResponseStartEvent", message)["status"] in commit_range
-                    or message["status"] in extra_commit_statuses
-                ) and message["status"] not in extra_rollback_statuses:
-                    await session.commit()
-                else:
-                    await session.rollback()
-        finally:
-            if session and message["type"] in SESSION_TERMINUS_ASGI_EVENTS:
-                await session.close()
-                delete_litestar_scope_state(scope, SESSION_SCOPE_KEY)
-
+        if session is None:
+            return
+        commit: bool | None = None
+        if msg_type == HTTP_RESPONSE_START:
+            commit = cast("HTTPResponseStartEvent", message)["status"] in commit_statuses
+        delete_litestar_scope_state(scope, SESSION_SCOPE_KEY)
+        if commit_in_background:
+            task = asyncio.create_task(_finalize_session(session, commit))
+            background_tasks.add(task)
+            task.add_done_callback(_background_task_done)
+            return
+        await _finalize_session(session, commit)
+
+    # exposed so that ``SQLAlchemyAsyncConfig.on_shutdown`` can await the sessions still being finalized
+    handler.background_tasks = background_tasks  # type: ignore[attr-defined]
     return handler
 
 
@@ -136,16 +206,23 @@ class SQLAlchemyAsyncConfig(_SQLAlchemyAsyncConfig):
     def create_session_maker(self) -> Callable[[], AsyncSession]:
         """Get a session maker. If none exists yet, create one.
 
+        Unless configured otherwise, sessions are created with ``expire_on_commit=False`` so that instances remain
+        usable after a commit without an implicit refresh, which an async session cannot perform lazily.
+
         Returns:
             Session factory used by the plugin.
         """
         if self.session_maker:
             return self.session_maker
+        if self._session_maker is not None:
+            return self._session_maker
 
         session_kws = self.session_config_dict
+        session_kws.setdefault("expire_on_commit", False)
         if session_kws.get("bind") is None:
             session_kws["bind"] = self.get_engine()
-        return self.session_maker_class(**session_kws)
+        self._session_maker = self.session_maker_class(**session_kws)
+        return self._session_maker
 
     def provide_engine(self, state: State) -> AsyncEngine:
         """Create an engine instance.
@@ -153,10 +230,14 @@ class SQLAlchemyAsyncConfig(_SQLAlchemyAsyncConfig):
         Args:
             state: The ``Litestar.state`` instance.
 
+        Raises:
+            KeyError: If the engine has not been added to the application state.
+
         Returns:
             An engine instance.
         """
-        return cast("AsyncEngine", state.get(self.engine_app_state_key))
+        engine: AsyncEngine = state[self.engine_app_state_key]
+        return engine
 
     def provide_session(self, state: State, scope: Scope) -> AsyncSession:
         """Create a session instance.
@@ -168,10 +249,9 @@ class SQLAlchemyAsyncConfig(_SQLAlchemyAsyncConfig):
         Returns:
             A session instance.
         """
-        session = cast("AsyncSession | None", get_litestar_scope_state(scope, SESSION_SCOPE_KEY))
+        session: AsyncSession | None = get_litestar_scope_state(scope, SESSION_SCOPE_KEY)
         if session is None:
-            session_maker = cast("Callable[[], AsyncSession]", state[self.session_maker_app_state_key])
-            session = session_maker()
+            session = state[self.session_maker_app_state_key]()
             set_litestar_scope_state(scope, SESSION_SCOPE_KEY, session)
         return session
 
@@ -193,6 +273,9 @@ class SQLAlchemyAsyncConfig(_SQLAlchemyAsyncConfig):
         Returns:
             None
         """
+        background_tasks: set[asyncio.Task[None]] = getattr(self.before_send_handler, "background_tasks", set())
+        if background_tasks:
+            await asyncio.gather(*background_tasks, return_exceptions=True)
         engine = cast("AsyncEngine", app.state.pop(self.engine_app_state_key))
         await engine.dispose()
 
@@ -203,7 +286,7 @@ class SQLAlchemyAsyncConfig(_SQLAlchemyAsyncConfig):
             app (Litestar): The ``Litestar`` instance
         """
         async with self.get_engine().begin() as conn:
-            await conn.run_sync(self.alembic_config.target_metadata.create_all)
+            await conn.run_sync(create_missing_tables, self.alembic_config.target_metadata)
 
     def create_app_state_items(self) -> dict[str, Any]:
         """Key/value pairs to be stored in application state."""
@@ -215,7 +298,15 @@ class SQLAlchemyAsyncConfig(_SQLAlchemyAsyncConfig):
     def update_app_state(self, app: Litestar) -> None:
         """Set the app state with engine and session.
 
+        The items come from :meth:`create_app_state_items`, which is only called if one of them is missing. Items
+        already present in the app state, e.g. on lifespan re-entry, are left untouched.
+
         Args:
             app: The ``Litestar`` instance.
         """
-        app.state.update(self.create_app_state_items())
+        state = app.state
+        if self.engine_app_state_key in state and self.session_maker_app_state_key in state:
+            return
+        for key, value in self.create_app_state_items().items():
+            if key not in state:
+                state[key] = value
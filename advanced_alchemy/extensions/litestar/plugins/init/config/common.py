@@ -1,6 +1,47 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from litestar.constants import HTTP_DISCONNECT, HTTP_RESPONSE_START, WEBSOCKET_CLOSE, WEBSOCKET_DISCONNECT
+from sqlalchemy import inspect
+
+if TYPE_CHECKING:
+    from sqlalchemy import Connection, MetaData
 
 SESSION_SCOPE_KEY = "_sqlalchemy_db_session"
 """Session scope key."""
-SESSION_TERMINUS_ASGI_EVENTS = {HTTP_RESPONSE_START, HTTP_DISCONNECT, WEBSOCKET_DISCONNECT, WEBSOCKET_CLOSE}
+SESSION_TERMINUS_ASGI_EVENTS = frozenset({HTTP_RESPONSE_START, HTTP_DISCONNECT, WEBSOCKET_DISCONNECT, WEBSOCKET_CLOSE})
 """ASGI events that terminate a session scope."""
+
+
+def create_missing_tables(connection: Connection, metadata: MetaData) -> None:
+    """Create the tables in ``metadata`` unless all of them already exist.
+
+    A single table name lookup replaces the per-table existence checks of
+    :meth:`MetaData.create_all <sqlalchemy.schema.MetaData.create_all>` when the database is already up to date.
+    Metadata with standalone sequences or metadata-level ``before_create``/``after_create`` listeners always goes
+    through ``create_all``, which handles those even when every table exists.
+
+    Args:
+        connection: The connection to use.
+        metadata: The metadata to create.
+    """
+    if not _has_metadata_level_ddl(metadata):
+        existing_tables = set(inspect(connection).get_table_names())
+        if metadata.tables.keys() <= existing_tables:
+            return
+    metadata.create_all(bind=connection)
+
+
+def _has_metadata_level_ddl(metadata: MetaData) -> bool:
+    """Return whether ``create_all`` would emit DDL for ``metadata`` that is not tied to a table.
+
+    Args:
+        metadata: The metadata to check.
+
+    Returns:
+        ``True`` if the metadata has standalone sequences or metadata-level DDL listeners.
+    """
+    if metadata.dispatch.before_create or metadata.dispatch.after_create:
+        return True
+    return any(sequence.column is None for sequence in metadata._sequences.values())  # noqa: SLF001
@@ -4,6 +4,7 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Callable, cast
 
 from litestar.constants import HTTP_RESPONSE_START
+from litestar.status_codes import HTTP_200_OK, HTTP_300_MULTIPLE_CHOICES
 from litestar.utils import delete_litestar_scope_state, get_litestar_scope_state, set_litestar_scope_state
 from sqlalchemy import Engine
 from sqlalchemy.orm import Session
@@ -12,6 +13,7 @@ from advanced_alchemy.config.sync import SQLAlchemySyncConfig as _SQLAlchemySync
 from advanced_alchemy.extensions.litestar.plugins.init.config.common import (
     SESSION_SCOPE_KEY,
     SESSION_TERMINUS_ASGI_EVENTS,
+    create_missing_tables,
 )
 from advanced_alchemy.extensions.litestar.plugins.init.config.engine import EngineConfig
 
@@ -41,12 +43,53 @@ def default_before_send_handler(message: Message, scope: Scope) -> None:
     Returns:
         None
     """
+    if message["type"] not in SESSION_TERMINUS_ASGI_EVENTS:
+        return
     session = cast("Session | None", get_litestar_scope_state(scope, SESSION_SCOPE_KEY))
-    if session and message["type"] in SESSION_TERMINUS_ASGI_EVENTS:
+    if session:
         session.close()
         delete_litestar_scope_state(scope, SESSION_SCOPE_KEY)
 
 
+def _autocommit_success_handler(message: Message, scope: Scope) -> None:
+    """Handle commit/rollback on ``2XX`` responses, closing and cleaning up sessions before sending.
+
+    Args:
+        message: ASGI-``Message``
+        scope: An ASGI-``Scope``
+
+    Returns:
+        None
+    """
+    msg_type = message["type"]
+    if msg_type not in SESSION_TERMINUS_ASGI_EVENTS:
+        return
+    session = cast("Session | None", get_litestar_scope_state(scope, SESSION_SCOPE_KEY))
+    if session is None:
+        return
+    commit: bool | None = None
+    if msg_type == HTTP_RESPONSE_START:
+        commit = HTTP_200_OK <= cast("HTTPResponseStartEvent", message)["status"] < HTTP_300_MULTIPLE_CHOICES
+    delete_litestar_scope_state(scope, SESSION_SCOPE_KEY)
+    _finalize_session(session, commit)
+
+
+def _finalize_session(session: Session, commit: bool | None) -> None:
+    """Commit or roll back the session, then close it.
+
+    Args:
+        session: The session to finalize.
+        commit: ``True`` to commit, ``False`` to roll back and ``None`` to only close the session.
+    """
+    try:
+        if commit is True:
+            session.commit()
+        elif commit is False:
+            session.rollback()
+    finally:
+        session.close()
+
+
 def autocommit_handler_maker(
     commit_on_redirect: bool = False,
     extra_commit_statuses: set[int] | None = None,
@@ -71,7 +114,12 @@ def autocommit_handler_maker(
         msg = "Extra rollback statuses and commit statuses must not share any status codes"
         raise ValueError(msg)
 
-    commit_range = range(200, 300 if not commit_on_redirect else 400)
+    if not (commit_on_redirect or extra_commit_statuses or extra_rollback_statuses):
+        return _autocommit_success_handler
+
+    commit_statuses = frozenset(
+        (set(range(200, 400 if commit_on_redirect else 300)) | extra_commit_statuses) - extra_rollback_statuses,
+    )
 
     def handler(message: Message, scope: Scope) -> None:
         """Handle commit/rollback, closing and cleaning up sessions before sending.
@@ -83,20 +131,17 @@ def autocommit_handler_maker(
         Returns:
             None
         """
+        msg_type = message["type"]
+        if msg_type not in SESSION_TERMINUS_ASGI_EVENTS:
+            return
         session = cast("Session | None", get_litestar_scope_state(scope, SESSION_SCOPE_KEY))
-        try:
-            if session is not None and message["type"] == HTTP_RESPONSE_START:
-                if (
-                    cast("HTTPResponseStartEvent", message)["status"] in commit_range
-                    or message["status"] in extra_commit_statuses
-                ) and message["status"] not in extra_rollback_statuses:
-                    session.commit()
-                else:
-                    session.rollback()
-        finally:
-            if session and message["type"] in SESSION_TERMINUS_ASGI_EVENTS:
-                session.close()
-                delete_litestar_scope_state(scope, SESSION_SCOPE_KEY)
+        if session is None:
+            return
+        commit: bool | None = None
+        if msg_type == HTTP_RESPONSE_START:
+            commit = cast("HTTPResponseStartEvent", message)["status"] in commit_statuses
+        delete_litestar_scope_state(scope, SESSION_SCOPE_KEY)
+        _finalize_session(session, commit)
 
     return handler
 
@@ -140,11 +185,14 @@ class SQLAlchemySyncConfig(_SQLAlchemySyncConfig):
         """
         if self.session_maker:
             return self.session_maker
+        if self._session_maker is not None:
+            return self._session_maker
 
         session_kws = self.session_config_dict
         if session_kws.get("bind") is None:
             session_kws["bind"] = self.get_engine()
-        return self.session_maker_class(**session_kws)
+        self._session_maker = self.session_maker_class(**session_kws)
+        return self._session_maker
 
     def provide_engine(self, state: State) -> Engine:
         """Create an engine instance.
@@ -152,10 +200,14 @@ class SQLAlchemySyncConfig(_SQLAlchemySyncConfig):
         Args:
             state: The ``Litestar.state`` instance.
 
+        Raises:
+            KeyError: If the engine has not been added to the application state.
+
         Returns:
             An engine instance.
         """
-        return cast("Engine", state.get(self.engine_app_state_key))
+        engine: Engine = state[self.engine_app_state_key]
+        return engine
 
     def provide_session(self, state: State, scope: Scope) -> Session:
         """Create a session instance.
@@ -167,10 +219,9 @@ class SQLAlchemySyncConfig(_SQLAlchemySyncConfig):
         Returns:
             A session instance.
         """
-        session = cast("Session | None", get_litestar_scope_state(scope, SESSION_SCOPE_KEY))
+        session: Session | None = get_litestar_scope_state(scope, SESSION_SCOPE_KEY)
         if session is None:
-            session_maker = cast("Callable[[], Session]", state[self.session_maker_app_state_key])
-            session = session_maker()
+            session = state[self.session_maker_app_state_key]()
             set_litestar_scope_state(scope, SESSION_SCOPE_KEY, session)
         return session
 
@@ -202,7 +253,7 @@ class SQLAlchemySyncConfig(_SQLAlchemySyncConfig):
             app (Litestar): The ``Litestar`` instance
         """
         with self.get_engine().begin() as conn:
-            self.alembic_config.target_metadata.create_all(bind=conn)
+            create_missing_tables(conn, self.alembic_config.target_metadata)
 
     def create_app_state_items(self) -> dict[str, Any]:
         """Key/value pairs to be stored in application state."""
@@ -214,7 +265,15 @@ class SQLAlchemySyncConfig(_SQLAlchemySyncConfig):
     def update_app_state(self, app: Litestar) -> None:
         """Set the app state with engine and session.
 
+        The items come from :meth:`create_app_state_items`, which is only called if one of them is missing. Items
+        already present in the app state, e.g. on lifespan re-entry, are left untouched.
+
         Args:
             app: The ``Litestar`` instance.
         """
-        app.state.update(self.create_app_state_items())
+        state = app.state
+        if self.engine_app_state_key in state and self.session_maker_app_state_key in state:
+            return
+        for key, value in self.create_app_state_items().items():
+            if key not in state:
+                state[key] = value
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, cast
 
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
@@ -8,6 +9,8 @@ from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from advanced_alchemy.exceptions import ConflictError, RepositoryError
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from sqlalchemy.orm import InstrumentedAttribute
 
     from advanced_alchemy.base import ModelProtocol
@@ -46,9 +49,17 @@ def get_instrumented_attr(model: type[ModelProtocol], key: str | InstrumentedAtt
 
 def model_from_dict(model: ModelT, **kwargs: Any) -> ModelT:
     """Return ORM Object from Dictionary."""
-    data = {}
-    for column_name in model.__mapper__.columns.keys():  # noqa: SIM118
-        column_val = kwargs.get(column_name, None)
-        if column_val is not None:
-            data[column_name] = column_val
-    return model(**data)  # type: ignore  # noqa: PGH003
+    return model_from_mapping(model, kwargs)  # type: ignore[arg-type]
+
+
+def model_from_mapping(model: type[ModelT], data: Mapping[str, Any]) -> ModelT:
+    """Return ORM Object from a mapping, without unpacking it into keyword arguments first."""
+    column_names = _model_column_names(model)
+    kwargs = {key: value for key, value in data.items() if value is not None and key in column_names}
+    return model(**kwargs)
+
+
+@lru_cache(maxsize=None)
+def _model_column_names(model: type[ModelProtocol]) -> frozenset[str]:
+    """Return the mapped column attribute names of ``model``, resolved once per model."""
+    return frozenset(model.__mapper__.columns.keys())
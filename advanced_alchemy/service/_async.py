@@ -11,7 +11,7 @@ from typing import TYPE_CHECKING, Any, Generic, Iterable, cast
 from sqlalchemy.orm import InstrumentedAttribute
 
 from advanced_alchemy.exceptions import RepositoryError
-from advanced_alchemy.repository._util import model_from_dict
+from advanced_alchemy.repository._util import model_from_mapping
 from advanced_alchemy.repository.typing import ModelT
 
 if TYPE_CHECKING:
@@ -27,10 +27,19 @@ if TYPE_CHECKING:
 
 
 class SQLAlchemyAsyncRepositoryReadService(Generic[ModelT]):
-    """Service object that operates on a repository object."""
+    """Service object that operates on a repository object.
+
+    Instance state is held in ``__slots__``; subclasses that declare ``__slots__ = ()`` are created without a
+    per-instance ``__dict__``.
+    """
+
+    __slots__ = ("repository",)
 
     repository_type: type[SQLAlchemyAsyncRepository[ModelT]]
     match_fields: list[str] | None = None
+    force_basic_query_mode: bool = False
+    """Default for :meth:`list_and_count`. Set to ``True`` for backends without window function support, such as
+    MySQL < 8, to count with a separate query instead of ``COUNT(*) OVER ()``."""
 
     def __init__(
         self,
@@ -169,10 +178,39 @@ class SQLAlchemyAsyncRepositoryReadService(Generic[ModelT]):
         Returns:
             Representation of created instances.
         """
+        return self._parse_to_model(data)
+
+    def _parse_to_model(self, data: ModelT | dict[str, Any]) -> ModelT:
+        """Convert input into a model without any operation specific behavior.
+
+        Args:
+            data: Representation to be converted.
+
+        Returns:
+            The converted model instance.
+        """
         if isinstance(data, dict):
-            return model_from_dict(model=self.repository.model_type, **data)  # type: ignore  # noqa: PGH003
+            return model_from_mapping(self.repository.model_type, data)
         return data
 
+    async def to_models(self, data: Iterable[ModelT | dict[str, Any]], operation: str | None = None) -> list[ModelT]:
+        """Parse and Convert a batch of inputs into models.
+
+        The conversion runs in a single synchronous pass unless :meth:`to_model` has been overridden, in which case
+        the override is called for each item.
+
+        Args:
+            data: Representations to be converted.
+            operation: Optional operation flag passed through to an overridden :meth:`to_model`.
+
+        Returns:
+            The converted model instances.
+        """
+        if type(self).to_model is SQLAlchemyAsyncRepositoryReadService.to_model:
+            model_type = self.repository.model_type
+            return [model_from_mapping(model_type, datum) if isinstance(datum, dict) else datum for datum in data]
+        return [(await self.to_model(datum, operation)) for datum in data]
+
     async def list_and_count(
         self,
         *filters: FilterTypes,
@@ -190,11 +228,14 @@ class SQLAlchemyAsyncRepositoryReadService(Generic[ModelT]):
             statement: To facilitate customization of the underlying select query.
                 Defaults to :class:`SQLAlchemyAsyncRepository.statement <SQLAlchemyAsyncRepository>`
             force_basic_query_mode: Force list and count to use two queries instead of an analytical window function.
+                Defaults to :attr:`force_basic_query_mode`.
             **kwargs: Instance attribute value filters.
 
         Returns:
             List of instances and count of total collection, ignoring pagination.
         """
+        if force_basic_query_mode is None:
+            force_basic_query_mode = self.force_basic_query_mode
         return await self.repository.list_and_count(
             *filters,
             statement=statement,
@@ -239,15 +280,15 @@ class SQLAlchemyAsyncRepositoryReadService(Generic[ModelT]):
         Returns:
             The match filter instance or None
         """
-        return next(
-            (cast("FilterTypeT | None", filter_) for filter_ in filters if isinstance(filter_, filter_type)),
-            None,
-        )
+        match = next((filter_ for filter_ in filters if isinstance(filter_, filter_type)), None)
+        return cast("FilterTypeT | None", match)
 
 
 class SQLAlchemyAsyncRepositoryService(SQLAlchemyAsyncRepositoryReadService[ModelT]):
     """Service object that operates on a repository object."""
 
+    __slots__ = ()
+
     async def create(self, data: ModelT | dict[str, Any]) -> ModelT:
         """Wrap repository instance creation.
 
@@ -262,14 +303,15 @@ class SQLAlchemyAsyncRepositoryService(SQLAlchemyAsyncRepositoryReadService[Mode
 
     async def create_many(
         self,
-        data: list[ModelT | dict[str, Any]] | list[dict[str, Any]] | list[ModelT],
+        data: Iterable[ModelT | dict[str, Any]],
         auto_commit: bool | None = None,
         auto_expunge: bool | None = None,
     ) -> Sequence[ModelT]:
         """Wrap repository bulk instance creation.
 
         Args:
-            data: Representations to be created.
+            data: Representations to be created. Any iterable is accepted, including a generator, and is consumed
+                once while converting to models.
             auto_expunge: Remove object from session before returning. Defaults to
                 :class:`SQLAlchemyAsyncRepository.auto_expunge <SQLAlchemyAsyncRepository>`.
             auto_commit: Commit objects before returning. Defaults to
@@ -278,8 +320,8 @@ class SQLAlchemyAsyncRepositoryService(SQLAlchemyAsyncRepositoryReadService[Mode
         Returns:
             Representation of created instances.
         """
-        data = [(await self.to_model(datum, "create")) for datum in data]
-        return await self.repository.add_many(data=data, auto_commit=auto_commit, auto_expunge=auto_expunge)
+        models = await self.to_models(data, "create")
+        return await self.repository.add_many(data=models, auto_commit=auto_commit, auto_expunge=auto_expunge)
 
     async def update(
         self,
@@ -337,14 +379,14 @@ class SQLAlchemyAsyncRepositoryService(SQLAlchemyAsyncRepositoryReadService[Mode
 
     async def update_many(
         self,
-        data: list[ModelT | dict[str, Any]] | list[dict[str, Any]] | list[ModelT],
+        data: Iterable[ModelT | dict[str, Any]],
         auto_commit: bool | None = None,
         auto_expunge: bool | None = None,
     ) -> Sequence[ModelT]:
         """Wrap repository bulk instance update.
 
         Args:
-            data: Representations to be updated.
+            data: Representations to be updated. Any iterable is accepted and is consumed once.
             auto_expunge: Remove object from session before returning. Defaults to
                 :class:`SQLAlchemyAsyncRepository.auto_expunge <SQLAlchemyAsyncRepository>`.
             auto_commit: Commit objects before returning. Defaults to
@@ -353,8 +395,8 @@ class SQLAlchemyAsyncRepositoryService(SQLAlchemyAsyncRepositoryReadService[Mode
         Returns:
             Representation of updated instances.
         """
-        data = [(await self.to_model(datum, "update")) for datum in data]
-        return await self.repository.update_many(data, auto_commit=auto_commit, auto_expunge=auto_expunge)
+        models = await self.to_models(data, "update")
+        return await self.repository.update_many(models, auto_commit=auto_commit, auto_expunge=auto_expunge)
 
     async def upsert(
         self,
@@ -389,7 +431,8 @@ class SQLAlchemyAsyncRepositoryService(SQLAlchemyAsyncRepositoryReadService[Mode
             Updated or created representation.
         """
         data = await self.to_model(data, "upsert")
-        self.repository.set_id_attribute_value(item_id, data)
+        if item_id is not None:
+            data = self.repository.set_id_attribute_value(item_id=item_id, item=data)
         return await self.repository.upsert(
             data=data,
             attribute_names=attribute_names,
@@ -401,7 +444,7 @@ class SQLAlchemyAsyncRepositoryService(SQLAlchemyAsyncRepositoryReadService[Mode
 
     async def upsert_many(
         self,
-        data: list[ModelT | dict[str, Any]] | list[dict[str, Any]] | list[ModelT],
+        data: Iterable[ModelT | dict[str, Any]],
         auto_expunge: bool | None = None,
         auto_commit: bool | None = None,
         no_merge: bool = False,
@@ -411,7 +454,8 @@ class SQLAlchemyAsyncRepositoryService(SQLAlchemyAsyncRepositoryReadService[Mode
         Args:
             data: Instance to update existing, or be created. Identifier used to determine if an
                 existing instance exists is the value of an attribute on ``data`` named as value of
-                :attr:`~advanced_alchemy.repository.AbstractAsyncRepository.id_attribute`.
+                :attr:`~advanced_alchemy.repository.AbstractAsyncRepository.id_attribute`. Any iterable is accepted
+                and is consumed once.
             auto_expunge: Remove object from session before returning. Defaults to
                 :class:`SQLAlchemyAsyncRepository.auto_expunge <SQLAlchemyAsyncRepository>`.
             auto_commit: Commit objects before returning. Defaults to
@@ -423,9 +467,9 @@ class SQLAlchemyAsyncRepositoryService(SQLAlchemyAsyncRepositoryReadService[Mode
         Returns:
             Updated or created representation.
         """
-        data = [(await self.to_model(datum, "upsert")) for datum in data]
+        models = await self.to_models(data, "upsert")
         return await self.repository.upsert_many(
-            data=data,
+            data=models,
             auto_expunge=auto_expunge,
             auto_commit=auto_commit,
             no_merge=no_merge,
@@ -5,6 +5,7 @@ import asyncio
 import os
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Dict, Generator, Iterator, List, Literal, Type, Union, cast
+from unittest.mock import patch
 from uuid import UUID
 
 import pytest
@@ -69,6 +70,9 @@ AnyModelWithFetchedValue = Union[models_uuid.UUIDModelWithFetchedValue, models_b
 ModelWithFetchedValueRepository = SQLAlchemyAsyncRepository[AnyModelWithFetchedValue]
 ModelWithFetchedValueService = SQLAlchemyAsyncRepositoryService[AnyModelWithFetchedValue]
 
+AnyEventLog = Union[models_uuid.UUIDEventLog, models_bigint.BigIntEventLog]
+EventLogRepository = SQLAlchemyAsyncRepository[AnyEventLog]
+
 RawRecordData = List[Dict[str, Any]]
 
 
@@ -688,6 +692,16 @@ def model_with_fetched_value_repo(
     return cast(ModelWithFetchedValueRepository, repo)
 
 
+@pytest.fixture()
+def event_log_repo(any_session: AsyncSession | Session, repository_module: Any) -> EventLogRepository:
+    """Return an EventLogAsyncRepository or EventLogSyncRepository based on the current PK and session type"""
+    if isinstance(any_session, AsyncSession):
+        repo = repository_module.EventLogAsyncRepository(session=any_session)
+    else:
+        repo = repository_module.EventLogSyncRepository(session=any_session)
+    return cast(EventLogRepository, repo)
+
+
 def test_filter_by_kwargs_with_incorrect_attribute_name(author_repo: AuthorRepository) -> None:
     """Test SQLAlchemy filter by kwargs with invalid column name.
 
@@ -1196,6 +1210,13 @@ async def test_repo_fetched_value(
     assert obj.updated != first_time
 
 
+async def test_repo_event_log_default_logged_at(event_log_repo: EventLogRepository) -> None:
+    obj = await maybe_async(event_log_repo.add(event_log_repo.model_type(payload={"event": "created"})))
+    assert obj.logged_at is not None
+    assert obj.logged_at.tzinfo is not None
+    assert obj.payload == {"event": "created"}
+
+
 async def test_lazy_load(
     item_repo: ItemRepository,
     tag_repo: TagRepository,
@@ -1328,6 +1349,23 @@ async def test_service_list_and_count_basic_method(raw_authors: RawRecordData, a
     assert len(collection) == exp_count
 
 
+async def test_service_list_and_count_basic_method_default(
+    raw_authors: RawRecordData,
+    author_service: AuthorService,
+) -> None:
+    author_service.force_basic_query_mode = True
+    exp_count = len(raw_authors)
+    repository = author_service.repository
+    with patch.object(repository, "list_and_count", wraps=repository.list_and_count) as list_and_count_spy:
+        collection, count = await maybe_async(author_service.list_and_count())
+        assert list_and_count_spy.call_args.kwargs["force_basic_query_mode"] is True
+        await maybe_async(author_service.list_and_count(force_basic_query_mode=False))
+        assert list_and_count_spy.call_args.kwargs["force_basic_query_mode"] is False
+    assert exp_count == count
+    assert isinstance(collection, list)
+    assert len(collection) == exp_count
+
+
 async def test_service_list_and_count_method_empty(book_service: BookService) -> None:
     collection, count = await maybe_async(book_service.list_and_count())
     assert count == 0
@@ -1400,6 +1438,38 @@ async def test_service_create_many_method(
         assert obj.name in {"Testing 2", "Cody"}
 
 
+async def test_service_create_many_method_with_dicts(raw_authors: RawRecordData, author_service: AuthorService) -> None:
+    exp_count = len(raw_authors) + 2
+    objs = await maybe_async(
+        author_service.create_many(
+            [
+                {"name": "Testing 2", "dob": datetime.now().date()},
+                {"name": "Cody", "dob": datetime.now().date()},
+            ],
+        ),
+    )
+    count = await maybe_async(author_service.count())
+    assert exp_count == count
+    assert len(objs) == 2
+    for obj in objs:
+        assert isinstance(obj, author_service.repository.model_type)
+        assert obj.id is not None
+        assert obj.name in {"Testing 2", "Cody"}
+
+
+async def test_service_create_many_method_with_generator(
+    raw_authors: RawRecordData,
+    author_service: AuthorService,
+) -> None:
+    exp_count = len(raw_authors) + 3
+    objs = await maybe_async(
+        author_service.create_many({"name": f"Author {idx}", "dob": datetime.now().date()} for idx in range(3)),
+    )
+    count = await maybe_async(author_service.count())
+    assert exp_count == count
+    assert len(objs) == 3
+
+
 async def test_service_update_many_method(author_service: AuthorService) -> None:
     if author_service.repository._dialect.name.startswith("spanner") and os.environ.get("SPANNER_EMULATOR_HOST"):
         pytest.skip("Skipped on emulator")
@@ -1517,6 +1587,16 @@ async def test_service_upsert_method(
     assert upsert2_insert_obj.name == "Another Author"
 
 
+async def test_service_upsert_method_keeps_existing_id(author_service: AuthorService, first_author_id: Any) -> None:
+    exp_count = await maybe_async(author_service.count())
+    existing_obj = await maybe_async(author_service.get(first_author_id))
+    existing_obj.name = "Agatha C."
+    upsert_update_obj = await maybe_async(author_service.upsert(data=existing_obj))
+    assert upsert_update_obj.id == first_author_id
+    assert upsert_update_obj.name == "Agatha C."
+    assert await maybe_async(author_service.count()) == exp_count
+
+
 async def test_service_upsert_many_method(
     author_service: AuthorService,
     author_model: AuthorModel,
@@ -1,7 +1,7 @@
 """Example domain objects for testing."""
 from __future__ import annotations
 
-from datetime import date, datetime
+from datetime import date, datetime, timezone
 from typing import List
 
 from sqlalchemy import Column, FetchedValue, ForeignKey, String, Table, func
@@ -43,8 +43,8 @@ class BigIntBook(BigIntBase):
 class BigIntEventLog(BigIntAuditBase):
     """The event log domain object."""
 
-    logged_at: Mapped[datetime] = mapped_column(default=datetime.now())  # pyright: ignore
-    payload: Mapped[dict] = mapped_column(default=lambda: {})  # pyright: ignore
+    logged_at: Mapped[datetime] = mapped_column(default=lambda: datetime.now(timezone.utc))  # pyright: ignore
+    payload: Mapped[dict] = mapped_column(default=dict)  # pyright: ignore
 
 
 class BigIntModelWithFetchedValue(BigIntBase):
@@ -69,21 +69,21 @@ bigint_item_tag = Table(
 class BigIntItem(BigIntBase):
     name: Mapped[str] = mapped_column(String(length=50))  # pyright: ignore
     description: Mapped[str] = mapped_column(String(length=100), nullable=True)  # pyright: ignore
-    tags: Mapped[List[BigIntTag]] = relationship(secondary=lambda: bigint_item_tag, back_populates="items")
+    tags: Mapped[List[BigIntTag]] = relationship(secondary=bigint_item_tag, back_populates="items")
 
 
 class BigIntTag(BigIntBase):
     """The event log domain object."""
 
     name: Mapped[str] = mapped_column(String(length=50))  # pyright: ignore
-    items: Mapped[List[BigIntItem]] = relationship(secondary=lambda: bigint_item_tag, back_populates="tags")
+    items: Mapped[List[BigIntItem]] = relationship(secondary=bigint_item_tag, back_populates="tags")
 
 
 class BigIntRule(BigIntAuditBase):
     """The rule domain object."""
 
     name: Mapped[str] = mapped_column(String(length=250))  # pyright: ignore
-    config: Mapped[dict] = mapped_column(default=lambda: {})  # pyright: ignore
+    config: Mapped[dict] = mapped_column(default=dict)  # pyright: ignore
 
 
 class RuleAsyncRepository(SQLAlchemyAsyncRepository[BigIntRule]):
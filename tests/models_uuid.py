@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime
+from datetime import date, datetime, timezone
 from typing import List
 from uuid import UUID
 
@@ -41,8 +41,8 @@ class UUIDBook(UUIDBase):
 class UUIDEventLog(UUIDAuditBase):
     """The event log domain object."""
 
-    logged_at: Mapped[datetime] = mapped_column(default=datetime.now())  # pyright: ignore
-    payload: Mapped[dict] = mapped_column(default={})  # pyright: ignore
+    logged_at: Mapped[datetime] = mapped_column(default=lambda: datetime.now(timezone.utc))  # pyright: ignore
+    payload: Mapped[dict] = mapped_column(default=dict)  # pyright: ignore
 
 
 class UUIDModelWithFetchedValue(UUIDBase):
@@ -67,21 +67,21 @@ uuid_item_tag = Table(
 class UUIDItem(UUIDBase):
     name: Mapped[str] = mapped_column(String(length=50))  # pyright: ignore
     description: Mapped[str] = mapped_column(String(length=100), nullable=True)  # pyright: ignore
-    tags: Mapped[List[UUIDTag]] = relationship(secondary=lambda: uuid_item_tag, back_populates="items")
+    tags: Mapped[List[UUIDTag]] = relationship(secondary=uuid_item_tag, back_populates="items")
 
 
 class UUIDTag(UUIDAuditBase):
     """The event log domain object."""
 
     name: Mapped[str] = mapped_column(String(length=50))  # pyright: ignore
-    items: Mapped[List[UUIDItem]] = relationship(secondary=lambda: uuid_item_tag, back_populates="tags")
+    items: Mapped[List[UUIDItem]] = relationship(secondary=uuid_item_tag, back_populates="tags")
 
 
 class UUIDRule(UUIDAuditBase):
     """The rule domain object."""
 
     name: Mapped[str] = mapped_column(String(length=250))  # pyright: ignore
-    config: Mapped[dict] = mapped_column(default=lambda: {})  # pyright: ignore
+    config: Mapped[dict] = mapped_column(default=dict)  # pyright: ignore
 
 
 class RuleAsyncRepository(SQLAlchemyAsyncRepository[UUIDRule]):
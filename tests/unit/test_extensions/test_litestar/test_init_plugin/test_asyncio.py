@@ -1,17 +1,23 @@
 from __future__ import annotations
 
+import asyncio
 import random
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
+import pytest
 from litestar import Litestar, get
+from litestar.datastructures import State
 from litestar.testing import create_test_client
-from litestar.types.asgi_types import HTTPResponseStartEvent
-from litestar.utils import set_litestar_scope_state
+from litestar.types.asgi_types import HTTPResponseBodyEvent, HTTPResponseStartEvent
+from litestar.utils import get_litestar_scope_state, set_litestar_scope_state
 from pytest import MonkeyPatch
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.pool import QueuePool
 
-from advanced_alchemy.extensions.litestar.plugins import SQLAlchemyAsyncConfig, SQLAlchemyInitPlugin
+from advanced_alchemy.config import AsyncSessionConfig
+from advanced_alchemy.exceptions import ImproperConfigurationError
+from advanced_alchemy.extensions.litestar.plugins import EngineConfig, SQLAlchemyAsyncConfig, SQLAlchemyInitPlugin
 from advanced_alchemy.extensions.litestar.plugins.init.config.asyncio import (
     autocommit_before_send_handler,
     autocommit_handler_maker,
@@ -43,6 +49,15 @@ def test_default_before_send_handler() -> None:
         assert config.session_dependency_key not in captured_scope_state  # pyright: ignore
 
 
+def test_sync_queue_pool_raises() -> None:
+    """Test that configuring the sync-only ``QueuePool`` is rejected."""
+    with pytest.raises(ImproperConfigurationError):
+        SQLAlchemyAsyncConfig(
+            connection_string="sqlite+aiosqlite://",
+            engine_config=EngineConfig(poolclass=QueuePool),
+        )
+
+
 async def test_create_all_default(monkeypatch: MonkeyPatch) -> None:
     """Test default_before_send_handler."""
 
@@ -161,3 +176,149 @@ async def test_autocommit_handler_maker_rollback_statuses(create_scope: Callable
     }
     await custom_autocommit_handler(http_response_start, http_scope)
     mock_session.rollback.assert_awaited_once()
+
+
+async def test_before_send_handler_ignores_body_messages(create_scope: Callable[..., Scope]) -> None:
+    """Test that non-terminus messages leave the session untouched."""
+    config = SQLAlchemyAsyncConfig(
+        connection_string="sqlite+aiosqlite://",
+        before_send_handler=autocommit_before_send_handler,
+    )
+    app = Litestar(route_handlers=[], plugins=[SQLAlchemyInitPlugin(config)])
+    mock_session = MagicMock(spec=AsyncSession)
+    http_scope = create_scope(app=app)
+    set_litestar_scope_state(http_scope, SESSION_SCOPE_KEY, mock_session)
+    http_response_body: HTTPResponseBodyEvent = {
+        "type": "http.response.body",
+        "body": b"",
+        "more_body": True,
+    }
+    await autocommit_before_send_handler(http_response_body, http_scope)
+    mock_session.commit.assert_not_awaited()
+    mock_session.rollback.assert_not_awaited()
+    mock_session.close.assert_not_awaited()
+    assert get_litestar_scope_state(http_scope, SESSION_SCOPE_KEY) is mock_session
+
+
+async def test_before_send_handler_closes_session(create_scope: Callable[..., Scope]) -> None:
+    """Test that the session is closed and removed from scope state on response start."""
+    config = SQLAlchemyAsyncConfig(
+        connection_string="sqlite+aiosqlite://",
+        before_send_handler=autocommit_before_send_handler,
+    )
+    app = Litestar(route_handlers=[], plugins=[SQLAlchemyInitPlugin(config)])
+    mock_session = MagicMock(spec=AsyncSession)
+    http_scope = create_scope(app=app)
+    set_litestar_scope_state(http_scope, SESSION_SCOPE_KEY, mock_session)
+    http_response_start: HTTPResponseStartEvent = {
+        "type": "http.response.start",
+        "status": 200,
+        "headers": {},
+    }
+    await autocommit_before_send_handler(http_response_start, http_scope)
+    mock_session.close.assert_awaited_once()
+    assert get_litestar_scope_state(http_scope, SESSION_SCOPE_KEY) is None
+
+
+async def test_autocommit_handler_maker_commit_in_background(create_scope: Callable[..., Scope]) -> None:
+    """Test that the handler created by the handler maker can commit after the response is released."""
+    background_autocommit_handler = autocommit_handler_maker(commit_in_background=True)
+    config = SQLAlchemyAsyncConfig(
+        connection_string="sqlite+aiosqlite://",
+        before_send_handler=background_autocommit_handler,
+    )
+    app = Litestar(route_handlers=[], plugins=[SQLAlchemyInitPlugin(config)])
+    mock_session = MagicMock(spec=AsyncSession)
+    http_scope = create_scope(app=app)
+    set_litestar_scope_state(http_scope, SESSION_SCOPE_KEY, mock_session)
+    http_response_start: HTTPResponseStartEvent = {
+        "type": "http.response.start",
+        "status": random.randint(200, 299),
+        "headers": {},
+    }
+    await background_autocommit_handler(http_response_start, http_scope)
+    assert get_litestar_scope_state(http_scope, SESSION_SCOPE_KEY) is None
+    mock_session.commit.assert_not_awaited()
+    await asyncio.gather(*background_autocommit_handler.background_tasks)  # type: ignore[attr-defined]
+    mock_session.commit.assert_awaited_once()
+    mock_session.close.assert_awaited_once()
+
+
+async def test_autocommit_handler_maker_commit_in_background_logs_failure(
+    create_scope: Callable[..., Scope],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that a failed background commit is logged and the session is still closed."""
+    background_autocommit_handler = autocommit_handler_maker(commit_in_background=True)
+    mock_session = MagicMock(spec=AsyncSession)
+    mock_session.commit.side_effect = RuntimeError("commit failed")
+    http_scope = create_scope()
+    set_litestar_scope_state(http_scope, SESSION_SCOPE_KEY, mock_session)
+    http_response_start: HTTPResponseStartEvent = {
+        "type": "http.response.start",
+        "status": random.randint(200, 299),
+        "headers": {},
+    }
+    background_tasks = background_autocommit_handler.background_tasks  # type: ignore[attr-defined]
+    await background_autocommit_handler(http_response_start, http_scope)
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    await asyncio.sleep(0)
+    mock_session.close.assert_awaited_once()
+    assert not background_tasks
+    assert "Failed to commit or roll back the session in the background" in caplog.text
+
+
+def test_autocommit_handler_maker_background_tasks_per_handler() -> None:
+    """Test that each handler created by the handler maker keeps its own set of background tasks."""
+    first_handler = autocommit_handler_maker(commit_in_background=True)
+    second_handler = autocommit_handler_maker(commit_in_background=True)
+    assert first_handler.background_tasks is not second_handler.background_tasks  # type: ignore[attr-defined]
+
+
+async def test_on_shutdown_awaits_background_tasks(create_scope: Callable[..., Scope]) -> None:
+    """Test that on_shutdown waits for pending background commits before disposing of the engine."""
+    calls: list[str] = []
+
+    async def commit() -> None:
+        await asyncio.sleep(0)
+        calls.append("commit")
+
+    async def dispose() -> None:
+        calls.append("dispose")
+
+    background_autocommit_handler = autocommit_handler_maker(commit_in_background=True)
+    config = SQLAlchemyAsyncConfig(
+        connection_string="sqlite+aiosqlite://",
+        before_send_handler=background_autocommit_handler,
+    )
+    engine = MagicMock()
+    engine.dispose.side_effect = dispose
+    app = MagicMock()
+    app.state = State({config.engine_app_state_key: engine})
+    mock_session = MagicMock(spec=AsyncSession)
+    mock_session.commit.side_effect = commit
+    http_scope = create_scope()
+    set_litestar_scope_state(http_scope, SESSION_SCOPE_KEY, mock_session)
+    http_response_start: HTTPResponseStartEvent = {
+        "type": "http.response.start",
+        "status": random.randint(200, 299),
+        "headers": {},
+    }
+    await background_autocommit_handler(http_response_start, http_scope)
+    assert background_autocommit_handler.background_tasks  # type: ignore[attr-defined]
+    await config.on_shutdown(app)  # type: ignore[arg-type]
+    assert calls == ["commit", "dispose"]
+    mock_session.close.assert_awaited_once()
+    assert config.engine_app_state_key not in app.state
+
+
+def test_create_session_maker_expire_on_commit_default() -> None:
+    """Test that sessions do not expire on commit unless configured to."""
+    config = SQLAlchemyAsyncConfig(connection_string="sqlite+aiosqlite://")
+    assert config.create_session_maker().kw["expire_on_commit"] is False
+
+    config = SQLAlchemyAsyncConfig(
+        connection_string="sqlite+aiosqlite://",
+        session_config=AsyncSessionConfig(expire_on_commit=True),
+    )
+    assert config.create_session_maker().kw["expire_on_commit"] is True
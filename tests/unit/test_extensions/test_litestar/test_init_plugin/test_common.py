@@ -1,16 +1,18 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
 import pytest
 from litestar.constants import SCOPE_STATE_NAMESPACE
 from litestar.datastructures import State
-from sqlalchemy import create_engine
+from sqlalchemy import Column, Integer, MetaData, Sequence, Table, create_engine, event, inspect
 
+from advanced_alchemy.config.common import _invalidate_connection_only
 from advanced_alchemy.exceptions import ImproperConfigurationError
 from advanced_alchemy.extensions.litestar.plugins import SQLAlchemyAsyncConfig, SQLAlchemySyncConfig
-from advanced_alchemy.extensions.litestar.plugins.init.config.common import SESSION_SCOPE_KEY
+from advanced_alchemy.extensions.litestar.plugins.init.config.common import SESSION_SCOPE_KEY, create_missing_tables
 
 if TYPE_CHECKING:
     from typing import Any
@@ -47,6 +49,19 @@ def test_session_config_dict_with_no_provided_config(
     assert config.session_config_dict == {}
 
 
+def test_session_config_dict_does_not_copy_values(
+    config_cls: type[SQLAlchemySyncConfig],
+) -> None:
+    """Test session_config_dict passes configured objects through without copying them."""
+    engine = create_engine("sqlite://")
+    info = {"key": "value"}
+    config = config_cls()
+    config.session_config.bind = engine
+    config.session_config.info = info
+    assert config.session_config_dict["bind"] is engine
+    assert config.session_config_dict["info"] == info
+
+
 def test_config_create_engine_if_engine_instance_provided(
     config_cls: type[SQLAlchemySyncConfig],
 ) -> None:
@@ -114,6 +129,69 @@ def test_create_session_maker_if_no_session_maker_or_bind_provided(
     create_engine_mock.assert_called_once()
 
 
+def test_get_engine_reuses_created_engine(
+    config_cls: type[SQLAlchemySyncConfig],
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Test get_engine only creates the engine once."""
+    config = config_cls(connection_string="sqlite://")
+    create_engine_callable_mock = MagicMock(return_value=create_engine("sqlite://"))
+    monkeypatch.setattr(config, "create_engine_callable", create_engine_callable_mock)
+    assert config.get_engine() is config.get_engine()
+    assert config.engine_instance is None
+    create_engine_callable_mock.assert_called_once()
+
+
+def test_replace_config_after_get_engine(config_cls: type[SQLAlchemySyncConfig]) -> None:
+    """Test a config can be copied with a new connection string after it created an engine."""
+    create_engine_callable_mock = MagicMock(side_effect=lambda *_, **__: MagicMock())
+    config = config_cls(connection_string="sqlite://", create_engine_callable=create_engine_callable_mock)
+    engine = config.get_engine()
+    new_config = replace(config, connection_string="sqlite:///:memory:")
+    assert new_config.get_engine() is not engine
+    assert config.get_engine() is engine
+
+
+def test_get_engine_pool_recycle_on_disconnect_disabled(
+    config_cls: type[SQLAlchemySyncConfig],
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Test disabling pool_recycle_on_disconnect registers a handle_error listener instead of an engine kwarg."""
+    config = config_cls(connection_string="sqlite://")
+    config.engine_config.pool_recycle_on_disconnect = False
+    engine = create_engine("sqlite://")
+    monkeypatch.setattr(config, "create_engine_callable", MagicMock(return_value=engine))
+    assert "pool_recycle_on_disconnect" not in config.engine_config_dict
+    config.get_engine()
+    assert event.contains(engine, "handle_error", _invalidate_connection_only)
+
+
+def test_get_engine_pool_recycle_on_disconnect_disabled_with_engine_instance(
+    config_cls: type[SQLAlchemySyncConfig],
+) -> None:
+    """Test disabling pool_recycle_on_disconnect also applies to a provided engine, registering the listener once."""
+    engine = create_engine("sqlite://")
+    config = config_cls(engine_instance=engine)
+    config.engine_config.pool_recycle_on_disconnect = False
+    with patch("advanced_alchemy.config.common.event.listen", wraps=event.listen) as listen_mock:
+        assert config.get_engine() is engine
+        assert config.get_engine() is engine
+    listen_mock.assert_called_once_with(engine, "handle_error", _invalidate_connection_only)
+    assert event.contains(engine, "handle_error", _invalidate_connection_only)
+
+
+def test_create_session_maker_reuses_created_session_maker(
+    config_cls: type[SQLAlchemySyncConfig],
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Test create_session_maker only creates the session maker once."""
+    config = config_cls()
+    monkeypatch.setattr(config, "get_engine", MagicMock(return_value=create_engine("sqlite://")))
+    session_maker = config.create_session_maker()
+    assert config.session_maker is None
+    assert config.create_session_maker() is session_maker
+
+
 def test_create_session_instance_if_session_not_in_scope_state(
     config_cls: type[SQLAlchemySyncConfig],
 ) -> None:
@@ -143,3 +221,69 @@ def test_app_state(config_cls: type[SQLAlchemySyncConfig], monkeypatch: MonkeyPa
         }
         create_session_maker_mock.assert_called_once()
         create_engine_mock.assert_called_once()
+
+
+def test_create_missing_tables_skips_existing_tables() -> None:
+    """Test create_missing_tables only calls create_all when a table is missing."""
+    metadata = MetaData()
+    Table("test_table", metadata, Column("id", Integer, primary_key=True))
+    with create_engine("sqlite://").begin() as conn:
+        create_missing_tables(conn, metadata)
+        assert inspect(conn).has_table("test_table")
+        with patch.object(metadata, "create_all") as create_all_mock:
+            create_missing_tables(conn, metadata)
+        create_all_mock.assert_not_called()
+
+
+def test_create_missing_tables_creates_standalone_sequences() -> None:
+    """Test create_missing_tables still calls create_all for standalone sequences when every table exists."""
+    metadata = MetaData()
+    Table("test_table", metadata, Column("id", Integer, primary_key=True))
+    with create_engine("sqlite://").begin() as conn:
+        create_missing_tables(conn, metadata)
+        Sequence("test_sequence", metadata=metadata)
+        with patch.object(metadata, "create_all") as create_all_mock:
+            create_missing_tables(conn, metadata)
+        create_all_mock.assert_called_once_with(bind=conn)
+
+
+def test_create_missing_tables_runs_metadata_ddl_listeners() -> None:
+    """Test create_missing_tables fires metadata-level DDL listeners when every table exists."""
+    metadata = MetaData()
+    Table("test_table", metadata, Column("id", Integer, primary_key=True))
+    after_create = MagicMock()
+    with create_engine("sqlite://").begin() as conn:
+        create_missing_tables(conn, metadata)
+        event.listen(metadata, "after_create", after_create)
+        create_missing_tables(conn, metadata)
+    after_create.assert_called_once()
+
+
+def test_update_app_state_keeps_existing_items(config_cls: type[SQLAlchemySyncConfig]) -> None:
+    """Test update_app_state does not recreate items already in the app state."""
+    config = config_cls(connection_string="sqlite://")
+    engine, session_maker = MagicMock(), MagicMock()
+    app = MagicMock()
+    app.state = State({config.engine_app_state_key: engine, config.session_maker_app_state_key: session_maker})
+    with patch.object(config, "create_app_state_items") as create_app_state_items_mock:
+        config.update_app_state(app)
+        create_app_state_items_mock.assert_not_called()
+    assert app.state[config.engine_app_state_key] is engine
+    assert app.state[config.session_maker_app_state_key] is session_maker
+
+
+def test_update_app_state_fills_missing_items(config_cls: type[SQLAlchemySyncConfig]) -> None:
+    """Test update_app_state takes missing items from create_app_state_items."""
+    config = config_cls(connection_string="sqlite://")
+    engine, session_maker, new_engine = MagicMock(), MagicMock(), MagicMock()
+    app = MagicMock()
+    app.state = State({config.engine_app_state_key: engine})
+    with patch.object(
+        config,
+        "create_app_state_items",
+        return_value={config.engine_app_state_key: new_engine, config.session_maker_app_state_key: session_maker},
+    ) as create_app_state_items_mock:
+        config.update_app_state(app)
+        create_app_state_items_mock.assert_called_once()
+    assert app.state[config.engine_app_state_key] is engine
+    assert app.state[config.session_maker_app_state_key] is session_maker
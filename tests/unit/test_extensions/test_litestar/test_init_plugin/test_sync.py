@@ -4,10 +4,11 @@ import random
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
+import pytest
 from litestar import Litestar, get
 from litestar.testing import create_test_client
-from litestar.types.asgi_types import HTTPResponseStartEvent
-from litestar.utils import set_litestar_scope_state
+from litestar.types.asgi_types import HTTPResponseBodyEvent, HTTPResponseStartEvent
+from litestar.utils import get_litestar_scope_state, set_litestar_scope_state
 from pytest import MonkeyPatch
 from sqlalchemy.orm import Session
 
@@ -102,6 +103,23 @@ def test_before_send_handler_error_response(create_scope: Callable[..., Scope])
     mock_session.rollback.assert_called_once()
 
 
+def test_before_send_handler_closes_session_on_commit_error(create_scope: Callable[..., Scope]) -> None:
+    """Test that the session is closed and removed from the scope if the commit fails."""
+    mock_session = MagicMock(spec=Session)
+    mock_session.commit.side_effect = RuntimeError("commit failed")
+    http_scope = create_scope()
+    set_litestar_scope_state(http_scope, SESSION_SCOPE_KEY, mock_session)
+    http_response_start: HTTPResponseStartEvent = {
+        "type": "http.response.start",
+        "status": random.randint(200, 299),
+        "headers": {},
+    }
+    with pytest.raises(RuntimeError):
+        autocommit_before_send_handler(http_response_start, http_scope)
+    mock_session.close.assert_called_once()
+    assert get_litestar_scope_state(http_scope, SESSION_SCOPE_KEY) is None
+
+
 def test_autocommit_handler_maker_redirect_response(create_scope: Callable[..., Scope]) -> None:
     """Test that the handler created by the handler maker commits on redirect"""
     autocommit_redirect_handler = autocommit_handler_maker(commit_on_redirect=True)
@@ -160,3 +178,22 @@ def test_autocommit_handler_maker_rollback_statuses(create_scope: Callable[...,
     }
     custom_autocommit_handler(http_response_start, http_scope)
     mock_session.rollback.assert_called_once()
+
+
+def test_before_send_handler_ignores_body_messages(create_scope: Callable[..., Scope]) -> None:
+    """Test that non-terminus messages leave the session untouched."""
+    config = SQLAlchemySyncConfig(connection_string="sqlite://", before_send_handler=autocommit_before_send_handler)
+    app = Litestar(route_handlers=[], plugins=[SQLAlchemyInitPlugin(config)])
+    mock_session = MagicMock(spec=Session)
+    http_scope = create_scope(app=app)
+    set_litestar_scope_state(http_scope, SESSION_SCOPE_KEY, mock_session)
+    http_response_body: HTTPResponseBodyEvent = {
+        "type": "http.response.body",
+        "body": b"",
+        "more_body": True,
+    }
+    autocommit_before_send_handler(http_response_body, http_scope)
+    mock_session.commit.assert_not_called()
+    mock_session.rollback.assert_not_called()
+    mock_session.close.assert_not_called()
+    assert get_litestar_scope_state(http_scope, SESSION_SCOPE_KEY) is mock_session
@@ -11,11 +11,12 @@ from pytest_lazyfixture import lazy_fixture
 from sqlalchemy import String
 from sqlalchemy.exc import IntegrityError, InvalidRequestError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import InstrumentedAttribute, Mapped, Session, mapped_column
+from sqlalchemy.orm import InstrumentedAttribute, Mapped, Session, mapped_column, validates
 
 from advanced_alchemy import (
     SQLAlchemyAsyncRepository,
     SQLAlchemySyncRepository,
+    SQLAlchemySyncRepositoryService,
     base,
     wrap_sqlalchemy_exception,
 )
@@ -27,6 +28,7 @@ from advanced_alchemy.filters import (
     NotInCollectionFilter,
     OnBeforeAfter,
 )
+from advanced_alchemy.repository._util import model_from_dict
 from tests.helpers import maybe_async
 
 if TYPE_CHECKING:
@@ -809,3 +811,63 @@ def test_filter_collection_by_kwargs_raises_repository_exception_for_attribute_e
     )
     with pytest.raises(RepositoryError):
         _ = mock_repo.filter_collection_by_kwargs(mock_repo.statement, a=1)
+
+
+def test_model_from_dict_ignores_unknown_keys_and_none_values() -> None:
+    """Test model_from_dict only passes mapped columns with a value to the model."""
+    item_id = uuid4()
+    model = model_from_dict(UUIDModel, id=item_id, created_at=None, not_a_column="value")  # type: ignore[arg-type]
+    assert isinstance(model, UUIDModel)
+    assert model.id == item_id
+    assert model.created_at is None
+    assert not hasattr(model, "not_a_column")
+
+
+def test_service_get_or_upsert_uses_validated_model_values() -> None:
+    """Test get_or_upsert matches and upserts with the values of a model built from the kwargs."""
+
+    class ValidatedModel(base.UUIDBase):
+        """Model with a column normalized by a validator."""
+
+        __tablename__ = "validated_model"
+
+        name: Mapped[str] = mapped_column(String(length=50))  # pyright: ignore
+
+        @validates("name")
+        def validate_name(self, key: str, value: str) -> str:
+            return value.lower()
+
+    class Repo(SQLAlchemySyncRepository[ValidatedModel]):
+        """Repo with mocked out stuff."""
+
+        model_type = ValidatedModel
+
+    class Service(SQLAlchemySyncRepositoryService[ValidatedModel]):
+        """Service with a mocked out get_or_upsert."""
+
+        repository_type = Repo
+
+    service = Service(session=MagicMock(spec=Session, bind=MagicMock()), statement=MagicMock())
+    get_or_upsert_mock = MagicMock(return_value=(MagicMock(), True))
+    service.repository.get_or_upsert = get_or_upsert_mock  # type: ignore[method-assign]
+    service.get_or_upsert(match_fields=["name"], name="MiXeD")
+    assert get_or_upsert_mock.call_args.kwargs["name"] == "mixed"
+
+
+def test_service_subclass_with_empty_slots_has_no_instance_dict() -> None:
+    """Test a service subclass declaring empty ``__slots__`` is created without a ``__dict__``."""
+
+    class Repo(SQLAlchemySyncRepository[MagicMock]):
+        """Repo with mocked out stuff."""
+
+        model_type = MagicMock()  # pyright:ignore[reportGeneralTypeIssues]
+
+    class Service(SQLAlchemySyncRepositoryService[MagicMock]):
+        """Service with slots only."""
+
+        __slots__ = ()
+        repository_type = Repo
+
+    service = Service(session=MagicMock(spec=Session, bind=MagicMock()), statement=MagicMock())
+    assert isinstance(service.repository, Repo)
+    assert not hasattr(service, "__dict__")